@@ -0,0 +1,21 @@
+"""
+Gunicorn configuration for serving server.py with threaded workers.
+Run: gunicorn server:app
+"""
+import os
+
+bind = os.getenv('GUNICORN_BIND', '127.0.0.1:5000')
+
+# Handlers spend nearly all their time waiting on LLM APIs, page fetches and
+# yt-dlp, which release the GIL, so threads scale concurrency cheaply.
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+workers = int(os.getenv('GUNICORN_WORKERS', '2'))
+threads = int(os.getenv('GUNICORN_THREADS', '32'))
+
+# Caps concurrent client connections per worker for gthread (open keep-alive
+# connections count too) and for async workers (GUNICORN_WORKER_CLASS=gevent,
+# which patches the stdlib itself; requires `pip install gevent`)
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', '1000'))
+
+# Whisper fallback transcription of a long video can take minutes
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '300'))
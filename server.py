@@ -5,21 +5,39 @@ import re
 import json
 import time
 import tempfile
-from flask import Flask, request, jsonify
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from flask import Flask, Response, request, jsonify, stream_with_context
+from flask.json.provider import JSONProvider
 from urllib.parse import urlparse
-from datetime import datetime
+from datetime import date, timedelta
+from functools import lru_cache
 from flask_cors import CORS
-from bs4 import BeautifulSoup
+from flask_compress import Compress
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
 import yt_dlp
+import orjson
+from diskcache import Cache
 from dotenv import load_dotenv
 
 from dotenv import load_dotenv
 
 import google.generativeai as genai
+from google.generativeai import caching
 import openai
 import anthropic
 import torch
-import whisper
+import numpy as np
+import ctranslate2
+from faster_whisper import WhisperModel, BatchedInferencePipeline
+
+from text_parsing import (
+    caption_text_words, extract_heading_from_markdown, json3_caption_words, split_sentences
+)
 
 
 load_dotenv()
@@ -76,14 +94,106 @@ print(f"Active LLM Provider: {ACTIVE_PROVIDER}")
 
 
 print("Loading Whisper model for audio transcription...")
-WHISPER_DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
-whisper_model = whisper.load_model("base", device=WHISPER_DEVICE)
-print(f"Whisper model loaded on: {WHISPER_DEVICE}")
+# Ask CTranslate2, which actually runs the model, rather than torch whether a GPU is usable
+WHISPER_DEVICE = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+# int8 weights cut memory traffic; on GPU activations stay float16
+WHISPER_COMPUTE_TYPE = os.getenv(
+    'WHISPER_COMPUTE_TYPE', "int8_float16" if WHISPER_DEVICE == "cuda" else "int8"
+)
+WHISPER_BATCH_SIZE = 16 if WHISPER_DEVICE == "cuda" else 8
+# Distilled English-only model: close to full-size accuracy on English at a fraction of the decode cost
+WHISPER_MODEL_NAME = os.getenv('WHISPER_MODEL_NAME', 'distil-small.en')
+# English-only (.en) models need no language hint
+WHISPER_LANGUAGE = None if WHISPER_MODEL_NAME.endswith('.en') else 'en'
+
+def load_whisper_model(device, compute_type):
+    """Load the Whisper model; on GPU, transcribe 1s of silence to prove CUDA works and warm it up."""
+    model = WhisperModel(
+        WHISPER_MODEL_NAME,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=os.cpu_count() or 0,
+    )
+    if device == "cuda":
+        # Also pays CUDA context and kernel setup at boot rather than on the first real request
+        list(model.transcribe(np.zeros(16000, dtype=np.float32), language=WHISPER_LANGUAGE)[0])
+    return model
+
+try:
+    whisper_model = load_whisper_model(WHISPER_DEVICE, WHISPER_COMPUTE_TYPE)
+except Exception as e:
+    # Missing cuBLAS/cuDNN libraries only surface on load or first run
+    if WHISPER_DEVICE != "cuda":
+        raise
+    print(f"Whisper failed on CUDA ({e}), falling back to CPU")
+    WHISPER_DEVICE, WHISPER_COMPUTE_TYPE, WHISPER_BATCH_SIZE = "cpu", "int8", 8
+    whisper_model = load_whisper_model(WHISPER_DEVICE, WHISPER_COMPUTE_TYPE)
+# Decodes VAD-segmented chunks of one file in parallel batches
+whisper_pipeline = BatchedInferencePipeline(model=whisper_model)
+# Silero VAD settings: trim silences longer than 2s so the model never decodes them
+VAD_PARAMS = {
+    'threshold': 0.5,
+    'min_speech_duration_ms': 250,
+    'min_silence_duration_ms': 2000,
+    'speech_pad_ms': 400,
+}
+print(f"Whisper model {WHISPER_MODEL_NAME} loaded on: {whisper_model.model.device} ({WHISPER_COMPUTE_TYPE})")
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for request parsing and jsonify."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response instead of decoding to str and re-encoding
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE),
+            mimetype='application/json',
+        )
 
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
+# Compress JSON responses; leave event streams unbuffered
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 500
+app.config['COMPRESS_STREAMS'] = False
+Compress(app)
+
+
+# Shared HTTP session so repeat fetches reuse keep-alive connections
+HTTP_SESSION = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    # Retry connects and transient 5xx only: read retries would stretch the 15s timeout,
+    # and the last 5xx response is returned so raise_for_status() reports its status
+    max_retries=Retry(
+        total=2, read=0, backoff_factor=0.3,
+        status_forcelist=[502, 503, 504], raise_on_status=False,
+    ),
+)
+HTTP_SESSION.mount('http://', _http_adapter)
+HTTP_SESSION.mount('https://', _http_adapter)
+# brotli is installed alongside flask-compress, so urllib3 can decode br responses
+HTTP_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Encoding': 'gzip, deflate, br',
+})
+
+# Worker pool for fanning out batched URL summaries
+MAX_BATCH_URLS = 10
+_batch_executor = ThreadPoolExecutor(max_workers=MAX_BATCH_URLS)
+
 
 
 SUMMARY_SYSTEM_PROMPT = """You are a precise summarization engine.
@@ -149,33 +259,36 @@ LENGTH_MAP = {
     'XL': 'xl',
 }
 
-def format_count(value):
-    """Format number with comma separators"""
-    return f"{value:,}"
+# Every accepted length value (old codes and spec names) to its spec name
+SUMMARY_LENGTH_NAMES = {
+    **{name: name for name in SUMMARY_LENGTH_SPECS},
+    **LENGTH_MAP,
+}
 
-def build_link_summary_prompt(content, url=None, title=None, site_name=None, 
-                               description=None, truncated=False, 
-                               has_transcript=False, content_type='text', 
-                               summary_length='medium'):
-    """
-    Build prompt for link/article/video summarization (from link-summary.ts)
-    """
-    content_characters = len(content)
-    
-    # Build context header
-    context_lines = []
-    if url:
-        context_lines.append(f"Source URL: {url}")
-    if title:
-        context_lines.append(f"Page name: {title}")
-    if site_name:
-        context_lines.append(f"Site: {site_name}")
-    if description:
-        context_lines.append(f"Page description: {description}")
-    if truncated:
-        context_lines.append("Note: Content truncated to the first portion available.")
-    
-    context_header = '\n'.join(context_lines)
+def normalize_summary_length(length):
+    """Map a requested length ('S'/'M'/'L'/'XL' or a spec name) to a spec name, defaulting to medium."""
+    return SUMMARY_LENGTH_NAMES.get(length, 'medium')
+
+# Length guidance depends only on the spec, so render it once per length
+PRESET_LENGTH_LINES = {
+    name: (
+        f"Target length: around {spec['target_characters']:,} characters "
+        f"(acceptable range {spec['min_characters']:,}-{spec['max_characters']:,}). "
+        f"This is a soft guideline; prioritize clarity."
+    )
+    for name, spec in SUMMARY_LENGTH_SPECS.items()
+}
+
+def _join_instruction_parts(lines):
+    """Join instruction lines around the per-request content length line into (head, tail)."""
+    split = lines.index(None)
+    head = '\n'.join(line for line in lines[:split] if line.strip())
+    tail = '\n'.join(line for line in lines[split + 1:] if line.strip())
+    return head, tail
+
+def _link_instruction_parts(summary_length, needs_headings, has_transcript):
+    """Static link-summary instructions for one (length, headings, transcript) combination."""
+    spec = SUMMARY_LENGTH_SPECS[summary_length]
     
     # Determine audience line based on content type
     audience_line = (
@@ -184,25 +297,6 @@ def build_link_summary_prompt(content, url=None, title=None, site_name=None,
         "You summarize online articles for curious Twitter users who want the gist before deciding to dive in."
     )
     
-    # Get length spec
-    spec = SUMMARY_LENGTH_SPECS[summary_length]
-    
-    # Build length guidance
-    preset_length_line = (
-        f"Target length: around {format_count(spec['target_characters'])} characters "
-        f"(acceptable range {format_count(spec['min_characters'])}-{format_count(spec['max_characters'])}). "
-        f"This is a soft guideline; prioritize clarity."
-    )
-    
-    content_length_line = (
-        f"Extracted content length: {format_count(content_characters)} characters. "
-        f"Hard limit: never exceed this length. If the requested length is larger, "
-        f"do not pad—finish early rather than adding filler."
-        if content_characters > 0 else ""
-    )
-    
-    # Determine if headings needed (xl, xxl, or content > 6000 chars)
-    needs_headings = summary_length in ('xl', 'xxl') or content_characters >= 6000
     heading_instruction = (
         'Use Markdown headings with the "### " prefix to break sections. '
         'Include at least 3 headings and start with a heading. Do not use bold for headings.'
@@ -218,8 +312,8 @@ def build_link_summary_prompt(content, url=None, title=None, site_name=None,
         if has_transcript else ""
     )
     
-    # Build base instructions
-    base_instructions = [
+    # None marks where the per-request content length line goes
+    return _join_instruction_parts([
         "IMPORTANT: Start your response with a concise, descriptive title using '### ' prefix. The title should be 3-8 words that capture the main topic or key insight. Do NOT just repeat the page name.",
         "Hard rules: never mention sponsor/ads; use straight quotation marks only (no curly quotes).",
         "Apostrophes in contractions are OK.",
@@ -228,8 +322,8 @@ def build_link_summary_prompt(content, url=None, title=None, site_name=None,
         spec['guidance'],
         spec['formatting'],
         heading_instruction,
-        preset_length_line,
-        content_length_line,
+        PRESET_LENGTH_LINES[summary_length],
+        None,
         "Keep the response compact by avoiding blank lines between sentences or list items; use only the single newlines required by the formatting instructions.",
         "Do not use emojis, disclaimers, or speculation.",
         "Write in direct, factual language.",
@@ -238,10 +332,96 @@ def build_link_summary_prompt(content, url=None, title=None, site_name=None,
         "Include 1-2 short exact excerpts (max 25 words each) formatted as Markdown italics using single asterisks when there is a strong, non-sponsor line. Use straight quotation marks (no curly) as needed. If no suitable line exists, omit excerpts. Never include ad/sponsor/boilerplate excerpts and do not mention them.",
         "Base everything strictly on the provided content and never invent details.",
         "Final check: remove any sponsor/ad references or mentions of skipping/ignoring content. Ensure excerpts (if any) are italicized and use only straight quotes.",
-    ]
+    ])
+
+def _file_instruction_parts(summary_length, should_ignore_sponsors):
+    """Static file-summary instructions for one (length, sponsors) combination."""
+    spec = SUMMARY_LENGTH_SPECS[summary_length]
     
-    # Filter empty lines and join
-    instructions = '\n'.join([line for line in base_instructions if line.strip()])
+    # NOTE: NO quotation marks allowed for files; None marks the content length line
+    return _join_instruction_parts([
+        "IMPORTANT: Start your response with a concise, descriptive title using '### ' prefix. The title should be 3-8 words that capture the main topic or key insight.",
+        "Hard rules: never mention sponsor/ads; never output quotation marks of any kind (straight or curly), even for titles.",
+        "Never include quotation marks in the output. Apostrophes in contractions are OK. If a title or excerpt would normally use quotes, remove them and optionally italicize the text instead.",
+        "You summarize files for curious users.",
+        "Summarize the attached file.",
+        "Be factual and do not invent details.",
+        (
+            "Omit sponsor messages, ads, promos, and calls-to-action (including podcast ad reads), "
+            "even if they appear in the transcript. Do not mention or acknowledge them, and do not say "
+            "you skipped or ignored anything. Avoid sponsor/ad/promo language, brand names like Squarespace, "
+            "or CTA phrases like discount code."
+            if should_ignore_sponsors else ""
+        ),
+        spec['guidance'],
+        spec['formatting'],
+        "Format the answer in Markdown.",
+        "Use short paragraphs; use bullet lists only when they improve scanability; avoid rigid templates.",
+        "If a standout line is present, include 1-2 short exact excerpts (max 25 words each) formatted as Markdown italics using single asterisks only. Do not use quotation marks of any kind (straight or curly). Remove any quotation marks from excerpts. If you cannot format an italic excerpt, omit it. Never include ad/sponsor/boilerplate excerpts and do not mention them.",
+        "Do not use emojis.",
+        PRESET_LENGTH_LINES[summary_length],
+        None,
+        "Final check: remove any sponsor/ad references or mentions of skipping/ignoring content. Remove any quotation marks. Ensure standout excerpts are italicized; otherwise omit them.",
+        "Return only the summary.",
+    ])
+
+# Instructions depend only on a few flags, so render every combination once at import
+LINK_INSTRUCTION_PARTS = {
+    (name, needs_headings, has_transcript): _link_instruction_parts(name, needs_headings, has_transcript)
+    for name in SUMMARY_LENGTH_SPECS
+    for needs_headings in (False, True)
+    for has_transcript in (False, True)
+}
+FILE_INSTRUCTION_PARTS = {
+    (name, should_ignore_sponsors): _file_instruction_parts(name, should_ignore_sponsors)
+    for name in SUMMARY_LENGTH_SPECS
+    for should_ignore_sponsors in (False, True)
+}
+
+def _content_length_line(content_characters):
+    """Per-request hard length limit line, empty for empty content."""
+    return (
+        f"Extracted content length: {content_characters:,} characters. "
+        f"Hard limit: never exceed this length. If the requested length is larger, "
+        f"do not pad—finish early rather than adding filler."
+        if content_characters > 0 else ""
+    )
+
+def _render_instructions(parts, content_length_line):
+    """Splice the content length line into precomputed (head, tail) instructions."""
+    return '\n'.join(part for part in (parts[0], content_length_line, parts[1]) if part)
+
+def build_link_summary_prompt(content, url=None, title=None, site_name=None, 
+                               description=None, truncated=False, 
+                               has_transcript=False, content_type='text', 
+                               summary_length='medium'):
+    """
+    Build prompt for link/article/video summarization (from link-summary.ts)
+    """
+    content_characters = len(content)
+    
+    # Build context header
+    context_lines = []
+    if url:
+        context_lines.append(f"Source URL: {url}")
+    if title:
+        context_lines.append(f"Page name: {title}")
+    if site_name:
+        context_lines.append(f"Site: {site_name}")
+    if description:
+        context_lines.append(f"Page description: {description}")
+    if truncated:
+        context_lines.append("Note: Content truncated to the first portion available.")
+    
+    context_header = '\n'.join(context_lines)
+    
+    # Determine if headings needed (xl, xxl, or content > 6000 chars)
+    needs_headings = summary_length in ('xl', 'xxl') or content_characters >= 6000
+    
+    instructions = _render_instructions(
+        LINK_INSTRUCTION_PARTS[summary_length, needs_headings, bool(has_transcript)],
+        _content_length_line(content_characters)
+    )
     
     # Build tagged prompt
     return f"""<instructions>
@@ -262,29 +442,10 @@ def build_file_summary_prompt(content, filename=None, media_type=None,
     Build prompt for file summarization (from file.ts)
     NOTE: File summaries use stricter rules - NO quotation marks at all
     """
-    content_characters = len(content)
-    
     # Determine if we should ignore sponsors (audio/video files)
-    should_ignore_sponsors = is_audio_video or (
+    should_ignore_sponsors = bool(is_audio_video or (
         media_type and (media_type.startswith('audio/') or media_type.startswith('video/'))
-    )
-    
-    # Get length spec
-    spec = SUMMARY_LENGTH_SPECS[summary_length]
-    
-    # Build length guidance
-    preset_length_line = (
-        f"Target length: around {format_count(spec['target_characters'])} characters "
-        f"(acceptable range {format_count(spec['min_characters'])}-{format_count(spec['max_characters'])}). "
-        f"This is a soft guideline; prioritize clarity."
-    )
-    
-    content_length_line = (
-        f"Extracted content length: {format_count(content_characters)} characters. "
-        f"Hard limit: never exceed this length. If the requested length is larger, "
-        f"do not pad—finish early rather than adding filler."
-        if content_characters > 0 else ""
-    )
+    ))
     
     # Build context header
     header_lines = []
@@ -295,35 +456,10 @@ def build_file_summary_prompt(content, filename=None, media_type=None,
     
     context_header = '\n'.join(header_lines)
     
-    # Build base instructions - NOTE: NO quotation marks allowed for files
-    base_instructions = [
-        "IMPORTANT: Start your response with a concise, descriptive title using '### ' prefix. The title should be 3-8 words that capture the main topic or key insight.",
-        "Hard rules: never mention sponsor/ads; never output quotation marks of any kind (straight or curly), even for titles.",
-        "Never include quotation marks in the output. Apostrophes in contractions are OK. If a title or excerpt would normally use quotes, remove them and optionally italicize the text instead.",
-        "You summarize files for curious users.",
-        "Summarize the attached file.",
-        "Be factual and do not invent details.",
-        (
-            "Omit sponsor messages, ads, promos, and calls-to-action (including podcast ad reads), "
-            "even if they appear in the transcript. Do not mention or acknowledge them, and do not say "
-            "you skipped or ignored anything. Avoid sponsor/ad/promo language, brand names like Squarespace, "
-            "or CTA phrases like discount code."
-            if should_ignore_sponsors else ""
-        ),
-        spec['guidance'],
-        spec['formatting'],
-        "Format the answer in Markdown.",
-        "Use short paragraphs; use bullet lists only when they improve scanability; avoid rigid templates.",
-        "If a standout line is present, include 1-2 short exact excerpts (max 25 words each) formatted as Markdown italics using single asterisks only. Do not use quotation marks of any kind (straight or curly). Remove any quotation marks from excerpts. If you cannot format an italic excerpt, omit it. Never include ad/sponsor/boilerplate excerpts and do not mention them.",
-        "Do not use emojis.",
-        preset_length_line,
-        content_length_line,
-        "Final check: remove any sponsor/ad references or mentions of skipping/ignoring content. Remove any quotation marks. Ensure standout excerpts are italicized; otherwise omit them.",
-        "Return only the summary.",
-    ]
-    
-    # Filter empty lines and join
-    instructions = '\n'.join([line for line in base_instructions if line.strip()])
+    instructions = _render_instructions(
+        FILE_INSTRUCTION_PARTS[summary_length, should_ignore_sponsors],
+        _content_length_line(len(content))
+    )
     
     # Build tagged prompt
     return f"""<instructions>
@@ -358,10 +494,7 @@ def build_summarization_prompt(content, content_type='text', length='M',
         media_type: MIME type (for file summaries)
     """
     # Normalize length parameter
-    if length in LENGTH_MAP:
-        summary_length = LENGTH_MAP[length]
-    else:
-        summary_length = length if length in SUMMARY_LENGTH_SPECS else 'medium'
+    summary_length = normalize_summary_length(length)
     
     # Route to appropriate builder
     if content_type == 'file':
@@ -389,55 +522,183 @@ def build_summarization_prompt(content, content_type='text', length='M',
         )
 
 
-_summary_cache = {}
-_transcription_cache = {}
-
-def extract_heading_from_markdown(text):
-    """Extract first heading from markdown text (### or ##), or generate a default."""
-    lines = text.strip().split('\n')
-    for line in lines:
-        line = line.strip()
-        if line.startswith('### '):
-            return line[4:].strip()
-        if line.startswith('## '):
-            return line[3:].strip()
-        if line.startswith('# '):
-            return line[2:].strip()
-    
-    
-    first_line = lines[0] if lines else text[:100]
-    # Remove any markdown formatting from first line
-    first_line = re.sub(r'^#+\s*', '', first_line)
-    first_line = re.sub(r'\*\*(.+?)\*\*', r'\1', first_line)
-    first_line = first_line.strip()
-    
-    
-    if len(first_line) > 80:
-        first_line = first_line[:77] + '...'
-    
-    return first_line if first_line else 'Summary'
-
-def get_summary_cache_key(content, length):
+# Summary cache: exact-match LRU keyed by content hash, plus an optional
+# semantic layer that matches near-duplicate inputs by embedding similarity.
+SUMMARY_CACHE_SIZE = int(os.getenv('SUMMARY_CACHE_SIZE', '2048'))
+SEMANTIC_CACHE_ENABLED = os.getenv('SEMANTIC_CACHE', '').lower() in ('1', 'true', 'yes')
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv('SEMANTIC_CACHE_THRESHOLD', '0.92'))
+SEMANTIC_EMBED_MODEL = 'models/text-embedding-004'
+SEMANTIC_EMBED_CHARS = 8000
+
+# Persistent tier shared across restarts and gunicorn workers
+SUMMA_CACHE_DIR = os.getenv('SUMMA_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'summa-cache'))
+SUMMARY_CACHE_TTL = 7 * 86400
+
+_summary_store = Cache(
+    os.path.join(SUMMA_CACHE_DIR, 'summaries'),
+    size_limit=2 << 30,
+    eviction_policy='least-recently-used',
+)
+_summary_cache = OrderedDict()
+_summary_cache_lock = threading.Lock()
+_semantic_store = Cache(os.path.join(SUMMA_CACHE_DIR, 'semantic'))
+_semantic_index = OrderedDict()  # cache key -> (embedding, length, provider, content_type)
+_semantic_keys = []
+_semantic_matrix = None
+
+# Transcripts are keyed by video ID so different URL forms of one video share an entry
+TRANSCRIPT_CACHE_TTL = 86400
+_transcription_cache = Cache(
+    os.path.join(SUMMA_CACHE_DIR, 'transcripts'),
+    size_limit=1 << 30,
+    eviction_policy='least-recently-used',
+)
+_YOUTUBE_ID_RE = re.compile(r'(?:[?&]v=|youtu\.be/|/(?:shorts|embed|live|v)/)([A-Za-z0-9_-]{11})')
+
+def get_summary_cache_key(content, length, provider, content_type='text'):
     """Generate cache key for summary."""
-    content_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
-    return f"{content_hash}_{length}"
-
-def cache_summary(key, summary):
-    """Store summary in cache."""
+    # BLAKE2b is faster than MD5 for large inputs; 128 bits is ample for a cache key.
+    # The prompt differs by content type (e.g. transcript rules), so it is part of the key;
+    # fields are fed to the hasher separately rather than concatenated onto the content.
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(content.encode('utf-8'))
+    hasher.update(f"\0{length}\0{provider}\0{content_type}".encode('utf-8'))
+    return hasher.hexdigest()
+
+def _remember_summary(key, summary):
+    """Insert into the in-memory LRU, evicting the least recently used entry when full."""
     _summary_cache[key] = summary
+    _summary_cache.move_to_end(key)
+    while len(_summary_cache) > SUMMARY_CACHE_SIZE:
+        _summary_cache.popitem(last=False)
+
+def _remember_embedding(key, embedding, length, provider, content_type):
+    """Add an entry to the in-memory semantic index, dropping the oldest when full."""
+    global _semantic_matrix
+    _semantic_index[key] = (embedding, length, provider, content_type)
+    _semantic_matrix = None
+    while len(_semantic_index) > SUMMARY_CACHE_SIZE:
+        _semantic_index.popitem(last=False)
+
+def cache_summary(key, summary, embedding=None, length=None, provider=None, content_type=None):
+    """Store summary in the memory and disk caches."""
+    with _summary_cache_lock:
+        if embedding is not None:
+            _remember_embedding(key, embedding, length, provider, content_type)
+        _remember_summary(key, summary)
+    _summary_store.set(key, summary, expire=SUMMARY_CACHE_TTL)
+    if embedding is not None:
+        _semantic_store.set(
+            key, (embedding.tolist(), length, provider, content_type), expire=SUMMARY_CACHE_TTL
+        )
 
 def get_cached_summary(key):
     """Retrieve cached summary if exists."""
-    return _summary_cache.get(key)
+    with _summary_cache_lock:
+        summary = _summary_cache.get(key)
+        if summary is not None:
+            _summary_cache.move_to_end(key)
+            return summary
+    
+    summary = _summary_store.get(key)
+    if summary is not None:
+        with _summary_cache_lock:
+            _remember_summary(key, summary)
+    return summary
+
+def embed_for_semantic_cache(text):
+    """Return a normalized embedding of text for the semantic cache, or None if disabled or too long."""
+    if not SEMANTIC_CACHE_ENABLED or 'gemini' not in LLM_CLIENTS:
+        return None
+    # An embedding of only a prefix would match inputs that merely share an intro,
+    # so longer inputs rely on the exact-match cache alone
+    if len(text) > SEMANTIC_EMBED_CHARS:
+        return None
+    try:
+        result = genai.embed_content(model=SEMANTIC_EMBED_MODEL, content=text)
+    except Exception as e:
+        print(f"Semantic cache embedding failed: {e}")
+        return None
+    embedding = torch.tensor(result['embedding'], dtype=torch.float32)
+    return torch.nn.functional.normalize(embedding, dim=0)
+
+def get_semantic_cached_summary(embedding, length, provider, content_type):
+    """Return a cached summary whose input is semantically near-identical, if any."""
+    global _semantic_keys, _semantic_matrix
+    with _summary_cache_lock:
+        if not _semantic_index:
+            return None
+        if _semantic_matrix is None:
+            _semantic_keys = list(_semantic_index)
+            _semantic_matrix = torch.stack([entry[0] for entry in _semantic_index.values()])
+        
+        # Single matrix-vector product gives cosine similarity against every stored input
+        scores = _semantic_matrix @ embedding
+        match_key = None
+        for idx in torch.argsort(scores, descending=True).tolist():
+            if scores[idx].item() < SEMANTIC_CACHE_THRESHOLD:
+                break
+            key = _semantic_keys[idx]
+            _, cached_length, cached_provider, cached_type = _semantic_index[key]
+            if (cached_length, cached_provider, cached_type) == (length, provider, content_type):
+                match_key = key
+                break
+    
+    if match_key is None:
+        return None
+    summary = get_cached_summary(match_key)
+    if summary is None:
+        # The summary expired or was evicted from disk; forget its vector too
+        with _summary_cache_lock:
+            if _semantic_index.pop(match_key, None) is not None:
+                _semantic_matrix = None
+    return summary
+
+def load_semantic_index():
+    """Reload persisted semantic cache vectors so near-duplicate hits survive restarts."""
+    if not SEMANTIC_CACHE_ENABLED:
+        return
+    with _summary_cache_lock:
+        for key in _semantic_store:
+            entry = _semantic_store.get(key)
+            # Entries written before content type was recorded cannot be matched safely
+            if entry is None or len(entry) != 4:
+                continue
+            vector, length, provider, content_type = entry
+            _remember_embedding(
+                key, torch.tensor(vector, dtype=torch.float32), length, provider, content_type
+            )
+    print(f"Loaded {len(_semantic_index)} semantic cache entries")
+
+load_semantic_index()
+
+def extract_youtube_video_id(url):
+    """Return the 11-character YouTube video ID from a URL, or None."""
+    match = _YOUTUBE_ID_RE.search(url)
+    return match.group(1) if match else None
+
+def _transcription_cache_key(url):
+    """Cache key for a video's transcription, falling back to the raw URL."""
+    video_id = extract_youtube_video_id(url)
+    return f"yt:{video_id}" if video_id else url
 
 def cache_transcription(url, transcript):
     """Cache transcription for a URL."""
-    _transcription_cache[url] = transcript
+    _transcription_cache.set(_transcription_cache_key(url), transcript, expire=TRANSCRIPT_CACHE_TTL)
     print(f"Cached transcription for {url}")
 
 def get_cached_transcription(url):
     """Get cached transcription if exists."""
-    return _transcription_cache.get(url)
+    return _transcription_cache.get(_transcription_cache_key(url))
+
+def cache_youtube_metadata(url, title, description):
+    """Cache a video's (title, description) next to its transcription."""
+    key = f"meta:{_transcription_cache_key(url)}"
+    _transcription_cache.set(key, (title, description), expire=TRANSCRIPT_CACHE_TTL)
+
+def get_cached_youtube_metadata(url):
+    """Get cached (title, description) for a video, or None."""
+    return _transcription_cache.get(f"meta:{_transcription_cache_key(url)}")
 
 def _summarize_with_gemini(model, prompt, max_tokens):
     """Summarize using Google Gemini"""
@@ -493,6 +754,172 @@ def _summarize_with_grok(client, prompt, max_tokens):
     )
     return response.choices[0].message.content.strip(), model_name
 
+def complete_with_provider(provider, prompt, max_tokens):
+    """Run a prompt on the given provider. Returns (text, model name)."""
+    client = LLM_CLIENTS[provider]
+    if provider == 'gemini':
+        return _summarize_with_gemini(client, prompt, max_tokens)
+    elif provider == 'openai':
+        return _summarize_with_openai(client, prompt, max_tokens)
+    elif provider == 'claude':
+        return _summarize_with_claude(client, prompt, max_tokens)
+    elif provider == 'grok':
+        return _summarize_with_grok(client, prompt, max_tokens)
+    raise ValueError(f"Unknown LLM provider '{provider}'")
+
+def _stream_with_gemini(model, prompt, max_tokens):
+    """Stream a summary from Google Gemini. Returns (text delta iterator, model name)"""
+    response = model.generate_content(
+        prompt,
+        generation_config={
+            'temperature': 0.3,
+            'top_p': 0.9,
+            'top_k': 40,
+            'max_output_tokens': max_tokens,
+        },
+        stream=True
+    )
+    
+    def deltas():
+        for chunk in response:
+            try:
+                text = chunk.text
+            except ValueError:
+                # Chunks without text parts (e.g. trailing finish metadata)
+                continue
+            if text:
+                yield text
+    
+    return deltas(), 'gemini-2.5-flash-lite'
+
+def _stream_with_openai(client, prompt, max_tokens, model_name=None):
+    """Stream a summary from an OpenAI-compatible API. Returns (text delta iterator, model name)"""
+    model_name = model_name or os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+    stream = client.chat.completions.create(
+        model=model_name,
+        messages=[
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.3,
+        max_tokens=max_tokens,
+        stream=True
+    )
+    deltas = (
+        chunk.choices[0].delta.content for chunk in stream
+        if chunk.choices and chunk.choices[0].delta.content
+    )
+    return deltas, model_name
+
+def _stream_with_claude(client, prompt, max_tokens):
+    """Stream a summary from Anthropic Claude. Returns (text delta iterator, model name)"""
+    model_name = os.getenv('ANTHROPIC_MODEL', 'claude-3-haiku-20240307')
+    
+    def deltas():
+        with client.messages.stream(
+            model=model_name,
+            max_tokens=max_tokens,
+            temperature=0.3,
+            messages=[
+                {"role": "user", "content": prompt}
+            ]
+        ) as stream:
+            yield from stream.text_stream
+    
+    return deltas(), model_name
+
+def _stream_with_grok(client, prompt, max_tokens):
+    """Stream a summary from xAI Grok. Returns (text delta iterator, model name)"""
+    return _stream_with_openai(client, prompt, max_tokens, model_name=os.getenv('GROK_MODEL', 'grok-beta'))
+
+def stream_with_provider(provider, prompt, max_tokens):
+    """Stream a prompt on the given provider. Returns (text delta iterator, model name)."""
+    client = LLM_CLIENTS[provider]
+    if provider == 'gemini':
+        return _stream_with_gemini(client, prompt, max_tokens)
+    elif provider == 'openai':
+        return _stream_with_openai(client, prompt, max_tokens)
+    elif provider == 'claude':
+        return _stream_with_claude(client, prompt, max_tokens)
+    elif provider == 'grok':
+        return _stream_with_grok(client, prompt, max_tokens)
+    raise ValueError(f"Unknown LLM provider '{provider}'")
+
+# Short inputs at the shortest length are summarized locally by their leading sentences
+EXTRACTIVE_MAX_CHARS = 800
+EXTRACTIVE_MIN_WORDS = 3
+
+def _extractive_summary(text, length, content_type):
+    """Summarize a short input with its first two sentences, without an LLM call. Returns None if unsuitable."""
+    # Transcripts are rarely punctuated, so their leading "sentence" is no summary
+    if length != 'S' or len(text) >= EXTRACTIVE_MAX_CHARS or content_type in ('youtube', 'video'):
+        return None
+    
+    sentences = split_sentences(text)
+    if not sentences or not sentences[0].endswith(('.', '!', '?')):
+        return None
+    if len(sentences[0].split()) < EXTRACTIVE_MIN_WORDS:
+        return None
+    
+    heading_words = sentences[0].rstrip('.!?').split()
+    heading = ' '.join(heading_words[:8])
+    if len(heading_words) > 8:
+        heading = heading.rstrip(',;:') + '...'
+    summary_text = f"### {heading}\n{' '.join(sentences[:2])}"
+    return {
+        'summary': summary_text,
+        'heading': heading,
+        'model': 'extractive',
+        'provider': 'extractive'
+    }
+
+def _prepare_summary_prompt(text, length, content_type, url, title, site_name,
+                            description, truncated):
+    """Build the summarization prompt. Returns (prompt, max_tokens)."""
+    # Build prompt
+    prompt = build_summarization_prompt(
+        content=text,
+        content_type=content_type,
+        length=length,
+        url=url,
+        title=title,
+        site_name=site_name,
+        description=description,
+        truncated=truncated
+    )
+    
+    # Get max tokens based on length spec
+    max_tokens = SUMMARY_LENGTH_SPECS[normalize_summary_length(length)]['max_tokens']
+    
+    return prompt, max_tokens
+
+_inflight_summaries = {}
+_inflight_lock = threading.Lock()
+
+def _coalesced(key, compute):
+    """Run compute() once per key; concurrent callers with the same key wait for its result."""
+    with _inflight_lock:
+        future = _inflight_summaries.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight_summaries[key] = future
+    
+    if not is_owner:
+        print("Joining in-flight summary request")
+        return future.result()
+    
+    try:
+        result = compute()
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight_summaries.pop(key, None)
+
 def generate_summary(text, length='M', content_type='text', url=None, title=None, 
                      site_name=None, description=None, truncated=False, provider=None):
     """
@@ -504,44 +931,40 @@ def generate_summary(text, length='M', content_type='text', url=None, title=None
     selected_provider = provider or ACTIVE_PROVIDER
     if not selected_provider or selected_provider not in LLM_CLIENTS:
         raise ValueError(f"LLM provider '{selected_provider}' not available. Check API keys.")
+    
+    extractive = _extractive_summary(text, length, content_type)
+    if extractive:
+        return extractive
 
-    cache_key = get_summary_cache_key(text, length) + f"_{selected_provider}"
+    cache_key = get_summary_cache_key(text, length, selected_provider, content_type)
     cached = get_cached_summary(cache_key)
     if cached:
         print(f"Cache hit for summary (length={length}, provider={selected_provider})")
         return cached
     
-    # Build prompt
-    prompt = build_summarization_prompt(
-        content=text,
-        content_type=content_type,
-        length=length,
-        url=url,
-        title=title,
-        site_name=site_name,
-        description=description,
-        truncated=truncated
-    )
+    # Identical requests already in flight share one upstream call
+    return _coalesced(cache_key, lambda: _generate_summary_uncached(
+        text, length, content_type, url, title, site_name, description,
+        truncated, selected_provider, cache_key
+    ))
+
+def _generate_summary_uncached(text, length, content_type, url, title, site_name,
+                               description, truncated, selected_provider, cache_key):
+    """Generate a summary on a cache miss and store it. Returns structured data."""
+    embedding = embed_for_semantic_cache(text)
+    if embedding is not None:
+        cached = get_semantic_cached_summary(embedding, length, selected_provider, content_type)
+        if cached:
+            print(f"Semantic cache hit for summary (length={length}, provider={selected_provider})")
+            cache_summary(cache_key, cached)
+            return cached
     
-    # Get max tokens based on length spec
-    summary_length = LENGTH_MAP.get(length, length)
-    if summary_length not in SUMMARY_LENGTH_SPECS:
-        summary_length = 'medium'
-    max_tokens = SUMMARY_LENGTH_SPECS[summary_length]['max_tokens']
+    prompt, max_tokens = _prepare_summary_prompt(
+        text, length, content_type, url, title, site_name, description, truncated
+    )
     
     try:
-        client = LLM_CLIENTS[selected_provider]
-        summary_text = ""
-        model_name = ""
-
-        if selected_provider == 'gemini':
-            summary_text, model_name = _summarize_with_gemini(client, prompt, max_tokens)
-        elif selected_provider == 'openai':
-            summary_text, model_name = _summarize_with_openai(client, prompt, max_tokens)
-        elif selected_provider == 'claude':
-            summary_text, model_name = _summarize_with_claude(client, prompt, max_tokens)
-        elif selected_provider == 'grok':
-            summary_text, model_name = _summarize_with_grok(client, prompt, max_tokens)
+        summary_text, model_name = complete_with_provider(selected_provider, prompt, max_tokens)
         
         # Extract heading
         heading = extract_heading_from_markdown(summary_text)
@@ -554,7 +977,7 @@ def generate_summary(text, length='M', content_type='text', url=None, title=None
         }
         
         # Cache result
-        cache_summary(cache_key, result)
+        cache_summary(cache_key, result, embedding, length, selected_provider, content_type)
         
         return result
         
@@ -562,6 +985,80 @@ def generate_summary(text, length='M', content_type='text', url=None, title=None
         print(f"{selected_provider} API error: {e}")
         raise
 
+def stream_summary(text, length='M', content_type='text', url=None, title=None,
+                   site_name=None, description=None, truncated=False, provider=None):
+    """
+    Stream a summary from the active or requested LLM provider.
+    Yields text deltas (str) as they arrive, then the structured data (dict)
+    that generate_summary would return. The completed summary is cached.
+    """
+    selected_provider = provider or ACTIVE_PROVIDER
+    if not selected_provider or selected_provider not in LLM_CLIENTS:
+        raise ValueError(f"LLM provider '{selected_provider}' not available. Check API keys.")
+    
+    extractive = _extractive_summary(text, length, content_type)
+    if extractive:
+        yield extractive['summary']
+        yield extractive
+        return
+    
+    cache_key = get_summary_cache_key(text, length, selected_provider, content_type)
+    cached = get_cached_summary(cache_key)
+    if cached:
+        print(f"Cache hit for summary (length={length}, provider={selected_provider})")
+        yield cached['summary']
+        yield cached
+        return
+    
+    prompt, max_tokens = _prepare_summary_prompt(
+        text, length, content_type, url, title, site_name, description, truncated
+    )
+    
+    try:
+        deltas, model_name = stream_with_provider(selected_provider, prompt, max_tokens)
+        
+        # Accumulate server-side so the finished summary can be cached
+        parts = []
+        for delta in deltas:
+            parts.append(delta)
+            yield delta
+        
+        summary_text = ''.join(parts).strip()
+        if not summary_text:
+            # e.g. a safety-blocked Gemini response; never cache an empty summary
+            raise ValueError(f"{selected_provider} returned an empty summary")
+        result = {
+            'summary': summary_text,
+            'heading': extract_heading_from_markdown(summary_text),
+            'model': model_name,
+            'provider': selected_provider
+        }
+        cache_summary(cache_key, result)
+        yield result
+        
+    except Exception as e:
+        print(f"{selected_provider} API error: {e}")
+        raise
+
+def summary_etag(text, length, content_type):
+    """ETag for a summary of text at length from the active provider (its summary cache key)."""
+    return get_summary_cache_key(text, length, ACTIVE_PROVIDER, content_type)
+
+def etag_response(payload, etag):
+    """JSON response, or an empty 304 if the client already holds this summary (If-None-Match)."""
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        response = jsonify(payload)
+    # Weak, so Flask-Compress leaves it alone instead of suffixing it per encoding
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'private, max-age=3600'
+    return response
+
+def sse_event(payload):
+    """Format a payload as a server-sent event."""
+    return f"data: {orjson.dumps(payload).decode('utf-8')}\n\n"
+
 def format_summary_response(structured_data):
     """Format the structured summary response."""
     return {
@@ -571,18 +1068,58 @@ def format_summary_response(structured_data):
         'model': structured_data.get('model', 'unknown')
     }
 
-def fetch_url_text(url):
-    """Fetch and extract text from a URL."""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
+# Upper bound on downloaded page size, and the tags that carry article text
+MAX_PAGE_BYTES = 5_000_000
+_CONTENT_STRAINER = SoupStrainer([
+    'article', 'main', 'section', 'p', 'h1', 'h2', 'h3', 'h4',
+    'li', 'blockquote', 'pre', 'td',
+    # Head metadata, read and then dropped in the same parse
+    'title', 'meta',
+])
+_BLANK_LINES_RE = re.compile(r'\s*\n\s*')
+
+def extract_page_metadata(soup):
+    """Extract (title, site_name, description) from a parsed page."""
+    try:
+        title = soup.find('title')
+        title = title.get_text().strip() if title else None
+        
+        site_name_meta = soup.find('meta', property='og:site_name')
+        site_name = site_name_meta.get('content') if site_name_meta else None
+        
+        description_meta = soup.find('meta', {'name': 'description'}) or soup.find('meta', property='og:description')
+        description = description_meta.get('content') if description_meta else None
+    except:
+        title = None
+        site_name = None
+        description = None
+    
+    return title, site_name, description
+
+def _extract_page_text(soup):
+    """Extract cleaned visible text from a parsed page."""
+    # Remove script, style, noscript fallbacks, nav, footer, ads
+    for tag in soup.select('script, style, noscript, nav, footer, aside, header'):
+        tag.decompose()
     
+    # Extract text
+    text = soup.get_text(separator='\n', strip=True)
+    
+    # Clean up whitespace around newlines inside strings (e.g. <pre>) in one regex pass
+    return _BLANK_LINES_RE.sub('\n', text)
+
+def fetch_url_text(url):
+    """Fetch a URL and extract its text and metadata in one parse. Returns a dict with text, title, site_name, description."""
     try:
         print(f"Fetching URL: {url}")
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
+        # Streamed responses hold their pooled connection until closed, even on error
+        with HTTP_SESSION.get(url, timeout=15, stream=True) as response:
+            response.raise_for_status()
+            # Cap memory on oversized or adversarial pages. Raw reads raise urllib3
+            # errors, not their requests wrappers, so those are handled below too
+            content = response.raw.read(MAX_PAGE_BYTES, decode_content=True)
         
-    except requests.Timeout:
+    except (requests.Timeout, ReadTimeoutError):
         raise Exception(f"Request timed out after 15 seconds. The website may be slow or unresponsive.")
     except requests.ConnectionError:
         raise Exception(f"Could not connect to {urlparse(url).netloc}. Check your internet connection or verify the URL is correct.")
@@ -595,39 +1132,57 @@ def fetch_url_text(url):
             raise Exception(f"Server error ({response.status_code}). The website may be experiencing issues.")
         else:
             raise Exception(f"HTTP error {response.status_code}: {str(e)}")
-    except requests.RequestException as e:
+    except (requests.RequestException, ProtocolError, DecodeError) as e:
         raise Exception(f"Request failed: {str(e)}")
     
     try:
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Remove script, style, nav, footer, ads
-        for tag in soup(['script', 'style', 'nav', 'footer', 'aside', 'header']):
+        # Parse only content-bearing and metadata tags with the C-backed lxml parser
+        soup = BeautifulSoup(content, 'lxml', parse_only=_CONTENT_STRAINER)
+        title, site_name, description = extract_page_metadata(soup)
+        for tag in soup.select('title'):
             tag.decompose()
+        text = _extract_page_text(soup)
         
-        # Extract text
-        text = soup.get_text(separator='\n', strip=True)
-        
-        # Clean up whitespace
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        text = '\n'.join(lines)
+        # Pages that lay out text in bare <div>s need the full document
+        if len(text) < 100:
+            text = _extract_page_text(BeautifulSoup(content, 'lxml'))
         
         if len(text) < 100:
             raise ValueError("Could not extract meaningful text from URL. The page may be empty, JavaScript-rendered, or paywalled.")
         
         print(f"Successfully extracted {len(text)} characters from URL")
-        return text
+        return {
+            'text': text,
+            'title': title,
+            'site_name': site_name,
+            'description': description,
+        }
         
     except Exception as e:
         if isinstance(e, ValueError):
             raise
         raise Exception(f"Failed to parse page content: {str(e)}")
 
+_citation_date = (None, '')
+
+def _citation_timestamp():
+    """Today's date for citations, formatted once per day."""
+    global _citation_date
+    today = date.today()
+    if _citation_date[0] != today:
+        _citation_date = (today, today.strftime('%Y-%m-%d'))
+    return _citation_date[1]
+
+@lru_cache(maxsize=256)
+def _citation_domain(url):
+    """Domain shown in citations for a URL."""
+    return urlparse(url).netloc.replace('www.', '')
+
 def generate_citation(url, summary_text):
     """Generate a citation for the summarized content."""
-    domain = urlparse(url).netloc.replace('www.', '')
+    domain = _citation_domain(url)
     first_sentence = summary_text.split('.')[0] if summary_text else 'Summary'
-    timestamp = datetime.now().strftime('%Y-%m-%d')
+    timestamp = _citation_timestamp()
     
     return {
         'text': f'"{first_sentence}..." - {domain}',
@@ -636,77 +1191,112 @@ def generate_citation(url, summary_text):
         'accessed': timestamp
     }
 
-def download_youtube_audio(url):
-    """Download audio from YouTube video."""
-    ydl_opts = {
-        'format': 'bestaudio/best',
-        'postprocessors': [{
-            'key': 'FFmpegExtractAudio',
-            'preferredcodec': 'mp3',
-            'preferredquality': '192',
-        }],
-        'outtmpl': os.path.join(tempfile.gettempdir(), '%(id)s.%(ext)s'),
-        'quiet': True,
-        'no_warnings': True,
-        # Critical options to bypass 403 errors
-        'http_headers': {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        },
-        'extractor_args': {'youtube': {'player_client': ['android', 'web']}},
-    }
-    
+# One yt-dlp configuration for both the caption probe and the audio fallback, so a
+# single extraction (player response, signature decryption) serves both
+YTDL_OPTS = {
+    'skip_download': True,
+    'quiet': True,
+    'no_warnings': True,
+    # Only caption URLs, duration and audio formats are needed; skip manifest and format probing
+    'youtube_include_dash_manifest': False,
+    'youtube_include_hls_manifest': False,
+    'check_formats': False,
+    'socket_timeout': 10,
+    # No re-encode: faster-whisper decodes the container itself and resamples to 16 kHz mono
+    'format': 'bestaudio[ext=m4a]/bestaudio/best',
+    'outtmpl': os.path.join(tempfile.gettempdir(), '%(id)s.%(ext)s'),
+    # Critical options to bypass 403 errors
+    'http_headers': {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    },
+    'extractor_args': {'youtube': {'player_client': ['android', 'web']}},
+}
+
+_ytdl_local = threading.local()
+
+def get_youtube_dl():
+    """This thread's long-lived YoutubeDL, so extractors and cookies load once per thread."""
+    ydl = getattr(_ytdl_local, 'ydl', None)
+    if ydl is None:
+        ydl = _ytdl_local.ydl = yt_dlp.YoutubeDL(dict(YTDL_OPTS))
+    return ydl
+
+def download_youtube_audio(ydl, info):
+    """Download audio for a video already extracted by ydl, reusing its player response."""
     try:
-        print(f"Downloading audio from YouTube: {url}")
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=True)
-            video_id = info['id']
-            audio_path = os.path.join(tempfile.gettempdir(), f"{video_id}.mp3")
-            
-            # Verify file was created
-            if not os.path.exists(audio_path):
-                raise Exception("Audio file was not created")
-            
-            print(f"Audio downloaded successfully: {audio_path}")
-            return audio_path, info
-            
+        print(f"Downloading audio from YouTube: {info.get('webpage_url')}")
+        ydl.params['skip_download'] = False
+        try:
+            info = ydl.process_ie_result(info, download=True)
+        finally:
+            # The instance is reused for probes that must not download
+            ydl.params['skip_download'] = True
+        audio_path = info['requested_downloads'][0]['filepath']
+        
+        # Verify file was created
+        if not os.path.exists(audio_path):
+            raise Exception("Audio file was not created")
+        
+        print(f"Audio downloaded successfully: {audio_path}")
+        return audio_path, info
+        
     except Exception as e:
         raise Exception(f"Failed to download YouTube audio: {str(e)}")
 
 def transcribe_audio_with_whisper(audio_path):
     """Transcribe audio file using Whisper."""
     print(f"Transcribing audio with Whisper on {WHISPER_DEVICE}...")
-    result = whisper_model.transcribe(audio_path, language='en', fp16=(WHISPER_DEVICE == 'cuda'))
-    transcript = result['text'].strip()
+    # Greedy decoding with no temperature fallback or cross-segment conditioning:
+    # summaries don't need perfect punctuation continuity, and fallback re-decodes are costly
+    segments, _ = whisper_pipeline.transcribe(
+        audio_path, language=WHISPER_LANGUAGE, batch_size=WHISPER_BATCH_SIZE,
+        vad_filter=True, vad_parameters=VAD_PARAMS,
+        beam_size=1, best_of=1, temperature=0.0, condition_on_previous_text=False,
+    )
+    transcript = ''.join(segment.text for segment in segments).strip()
     print(f"Whisper transcription complete: {len(transcript)} characters")
     return transcript
 
+# Caption formats yt-dlp can offer, best first: json3 is compact and needs no cue parsing
+_SUBTITLE_PRIORITY = ('json3', 'srv3', 'vtt', 'srv2', 'srv1')
+_SUBTITLE_EXTS = frozenset(_SUBTITLE_PRIORITY)
+
+def _fetch_json3_caption_parts(sub_url):
+    """Download json3 captions and return their text segments."""
+    sub_response = HTTP_SESSION.get(sub_url, timeout=15)
+    sub_response.raise_for_status()
+    return json3_caption_words(orjson.loads(sub_response.content))
+
+def _fetch_text_caption_parts(sub_url):
+    """Download WebVTT/srv captions and return their text words."""
+    sub_response = HTTP_SESSION.get(sub_url, timeout=15)
+    sub_response.raise_for_status()
+    sub_response.encoding = 'utf-8'
+    
+    return caption_text_words(sub_response.text)
+
 def fetch_youtube_transcript_with_fallback(url):
     """
     Fetch YouTube transcript with intelligent fallback strategy.
-    Returns: (transcript_text, method)
+    Returns: (transcript_text, method, info)
         method can be: 'cached', 'captions', or 'whisper'
+        info is the yt-dlp video info, or None when served from cache
     """
     # Check cache first
     cached = get_cached_transcription(url)
     if cached:
         print(f"Using cached transcription for {url}")
-        return cached, 'cached'
+        return cached, 'cached', None
     
     # Try to get captions using yt-dlp
     print(f"Attempting to extract captions for {url}...")
-    ydl_opts = {
-        'skip_download': True,
-        'writesubtitles': True,
-        'writeautomaticsub': True,
-        'subtitleslangs': ['en'],
-        'quiet': True,
-        'no_warnings': True,
-    }
-    
+    return _transcribe_youtube_video(url, get_youtube_dl())
+
+def _transcribe_youtube_video(url, ydl):
+    """Captions-then-Whisper transcription using one yt-dlp instance. Returns (transcript, method, info)."""
     info = None
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
+        info = ydl.extract_info(url, download=False)
     except Exception as e:
         print(f"Failed to extract video info: {e}")
         raise Exception(f"Failed to get video information: {str(e)}")
@@ -732,36 +1322,28 @@ def fetch_youtube_transcript_with_fallback(url):
     
     if subtitle_source:
         
-        sub_url = None
-        for sub in subtitle_source:
-            ext = sub.get('ext')
-            if ext in ('vtt', 'srv1', 'srv2', 'srv3', 'json3'):
-                sub_url = sub.get('url')
-                print(f"Found subtitle URL with extension: {ext}")
-                break
+        # Pick the best available format in one pass
+        by_ext = {
+            sub['ext']: sub.get('url') for sub in subtitle_source
+            if sub.get('ext') in _SUBTITLE_EXTS
+        }
+        sub_ext = next((ext for ext in _SUBTITLE_PRIORITY if ext in by_ext), None)
+        sub_url = by_ext.get(sub_ext)
         
         if sub_url:
+            print(f"Found subtitle URL with extension: {sub_ext}")
             try:
                 print(f"Fetching subtitles from URL...")
-                sub_response = requests.get(sub_url, timeout=15)
-                sub_content = sub_response.text
-                
-                
-                text_parts = []
-                lines = sub_content.split('\n')
-                for line in lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    if line:
-                        text_parts.append(line)
+                if sub_ext == 'json3':
+                    text_parts = _fetch_json3_caption_parts(sub_url)
+                else:
+                    text_parts = _fetch_text_caption_parts(sub_url)
                 
                 if text_parts:
                     transcript = ' '.join(text_parts)
                     print(f"Successfully extracted captions: {len(transcript)} characters")
                     cache_transcription(url, transcript)
-                    return transcript, 'captions'
+                    return transcript, 'captions', info
                 else:
                     print("Captions parsed but no text extracted")
             except Exception as e:
@@ -774,7 +1356,7 @@ def fetch_youtube_transcript_with_fallback(url):
     
     audio_path = None
     try:
-        audio_path, _ = download_youtube_audio(url)
+        audio_path, _ = download_youtube_audio(ydl, info)
         
         # Verify audio file exists and has content
         if not os.path.exists(audio_path):
@@ -790,7 +1372,7 @@ def fetch_youtube_transcript_with_fallback(url):
             raise Exception("Transcription too short, video may have no speech content")
         
         cache_transcription(url, transcript)
-        return transcript, 'whisper'
+        return transcript, 'whisper', info
         
     finally:
         # Clean up temp audio file
@@ -812,10 +1394,15 @@ def summarize_text():
         if not ACTIVE_PROVIDER:
             return jsonify({'error': 'No LLM provider configured. Check .env file.'}), 503
 
+        # A client revalidating a summary it already holds needs no generation at all
+        etag = summary_etag(text, length, 'text')
+        if request.if_none_match.contains_weak(etag):
+            return etag_response(None, etag)
+
         structured_data = generate_summary(text, length, content_type='text')
         response = format_summary_response(structured_data)
         
-        return jsonify({
+        return etag_response({
             **response,
             'original_content': text,
             'metadata': {
@@ -824,10 +1411,83 @@ def summarize_text():
                 'length': length,
                 'timestamp': time.time()
             }
-        })
+        }, etag)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def summarize_url_content(url, length='M'):
+    """Fetch a URL and summarize it. Returns the JSON-ready response payload."""
+    page = fetch_url_text(url)
+    text = page['text']
+    
+    structured_data = generate_summary(
+        text, length, content_type='webpage', url=url,
+        title=page['title'], site_name=page['site_name'], description=page['description']
+    )
+    return build_url_response(structured_data, url, text, length)
+
+def build_url_response(structured_data, url, text, length):
+    """Build the /summarize-url response payload from structured summary data."""
+    response = format_summary_response(structured_data)
+    citation = generate_citation(url, response.get('summary', ''))
+    
+    return {
+        **response,
+        'original_content': text,
+        'citation': citation,
+        'metadata': {
+            'source': url,
+            'length': length,
+            'timestamp': time.time()
+        }
+    }
+
+def summary_event_stream(text, length, build_response, **summary_kwargs):
+    """
+    Yield server-sent events for a streamed summary: {"delta": ...} per text
+    chunk, then {"done": true, ...build_response(structured_data)}, or
+    {"error": ...} if generation fails part-way.
+    """
+    try:
+        for item in stream_summary(text, length, **summary_kwargs):
+            if isinstance(item, str):
+                yield sse_event({'delta': item})
+                continue
+            yield sse_event({'done': True, **build_response(item)})
+    except Exception as e:
+        yield sse_event({'error': str(e)})
+
+@app.route('/summarize-stream', methods=['POST'])
+def summarize_text_stream():
+    """
+    Streaming variant of /summarize. Emits server-sent events:
+    {"delta": "..."} per text chunk, then {"done": true, ...} with the
+    same fields /summarize returns, or {"error": "..."} on failure.
+    """
+    data = request.get_json()
+    text = data.get('text', '')
+    length = data.get('length', 'M')
+    
+    if not text or len(text.strip()) < 20:
+        return jsonify({'error': 'Text must be at least 20 characters'}), 400
+    if not ACTIVE_PROVIDER:
+        return jsonify({'error': 'No LLM provider configured. Check .env file.'}), 503
+    
+    def build_response(structured_data):
+        return {
+            **format_summary_response(structured_data),
+            'original_content': text,
+            'metadata': {
+                'input_length': len(text),
+                'word_count': len(text.split()),
+                'length': length,
+                'timestamp': time.time()
+            }
+        }
+    
+    events = summary_event_stream(text, length, build_response, content_type='text')
+    return Response(stream_with_context(events), mimetype='text/event-stream')
+
 @app.route('/summarize-url', methods=['POST'])
 def summarize_url():
     data = request.get_json()
@@ -837,46 +1497,104 @@ def summarize_url():
     if not url:
         return jsonify({'error': 'No URL provided'}), 400
     try:
-        text = fetch_url_text(url)
-        
-        # Extract metadata for better prompting
-        try:
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.get(url, headers=headers, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            title = soup.find('title')
-            title = title.get_text().strip() if title else None
-            
-            site_name_meta = soup.find('meta', property='og:site_name')
-            site_name = site_name_meta.get('content') if site_name_meta else None
-            
-            description_meta = soup.find('meta', {'name': 'description'}) or soup.find('meta', property='og:description')
-            description = description_meta.get('content') if description_meta else None
-        except:
-            title = None
-            site_name = None
-            description = None
-        
-        structured_data = generate_summary(
-            text, length, content_type='webpage',
-            url=url, title=title, site_name=site_name, description=description
-        )
-        response = format_summary_response(structured_data)
-        citation = generate_citation(url, response.get('summary', ''))
-        
-        return jsonify({
-            **response,
-            'original_content': text,
-            'citation': citation,
-            'metadata': {
-                'source': url,
-                'length': length,
-                'timestamp': time.time()
-            }
-        })
+        result = summarize_url_content(url, length)
+        return etag_response(result, summary_etag(result['original_content'], length, 'webpage'))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/summarize-url-stream', methods=['POST'])
+def summarize_url_stream():
+    """Streaming variant of /summarize-url; same events as /summarize-stream."""
+    data = request.get_json()
+    url = data.get('url', '')
+    length = data.get('length', 'M')
+    
+    if not url:
+        return jsonify({'error': 'No URL provided'}), 400
+    if not ACTIVE_PROVIDER:
+        return jsonify({'error': 'No LLM provider configured. Check .env file.'}), 503
+    try:
+        page = fetch_url_text(url)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
+    text = page['text']
+    
+    events = summary_event_stream(
+        text, length, lambda structured_data: build_url_response(structured_data, url, text, length),
+        content_type='webpage', url=url,
+        title=page['title'], site_name=page['site_name'], description=page['description']
+    )
+    return Response(stream_with_context(events), mimetype='text/event-stream')
+
+@app.route('/summarize-urls', methods=['POST'])
+def summarize_urls():
+    """
+    Summarize several URLs concurrently. Each URL is fetched and summarized
+    on the shared worker pool; failures are reported per URL.
+    """
+    data = request.get_json()
+    urls = data.get('urls', [])
+    length = data.get('length', 'M')
+    
+    if not urls or not isinstance(urls, list):
+        return jsonify({'error': 'No URLs provided'}), 400
+    if len(urls) > MAX_BATCH_URLS:
+        return jsonify({'error': f'At most {MAX_BATCH_URLS} URLs can be summarized per request'}), 400
+    if not ACTIVE_PROVIDER:
+        return jsonify({'error': 'No LLM provider configured. Check .env file.'}), 503
+    
+    futures = [_batch_executor.submit(summarize_url_content, url, length) for url in urls]
+    results = []
+    for url, future in zip(urls, futures):
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append({'error': str(e), 'metadata': {'source': url, 'length': length}})
+    
+    return jsonify({'results': results})
+
+def fetch_youtube_source(url):
+    """Get a video's transcript and metadata. Returns (transcript, method, title, description)."""
+    # Get transcript with fallback
+    transcript, transcription_method, info = fetch_youtube_transcript_with_fallback(url)
+    
+    # Reuse the transcript's extraction, or metadata cached alongside the transcript
+    metadata = None if info else get_cached_youtube_metadata(url)
+    if metadata:
+        title, description = metadata
+        return transcript, transcription_method, title, description
+    
+    # Extract video metadata
+    try:
+        if info is None:
+            info = get_youtube_dl().extract_info(url, download=False)
+        title = info.get('title')
+        description = (info.get('description') or '')[:200]  # First 200 chars
+        cache_youtube_metadata(url, title, description)
+    except:
+        title = None
+        description = None
+    
+    return transcript, transcription_method, title, description
+
+def build_youtube_response(structured_data, url, transcript, length, transcription_method):
+    """Build the /summarize-youtube response payload from structured summary data."""
+    response = format_summary_response(structured_data)
+    citation = generate_citation(url, response.get('summary', ''))
+    
+    return {
+        **response,
+        'original_content': transcript,
+        'citation': citation,
+        'metadata': {
+            'source': 'YouTube',
+            'video_url': url,
+            'length': length,
+            'timestamp': time.time(),
+            'model': 'gemini-2.5-flash-lite',
+            'transcription_method': transcription_method
+        }
+    }
 
 @app.route('/summarize-youtube', methods=['POST'])
 def summarize_youtube():
@@ -887,84 +1605,50 @@ def summarize_youtube():
     if not url or ('youtube.com' not in url and 'youtu.be' not in url):
         return jsonify({'error': 'Invalid YouTube URL'}), 400
     try:
-        # Get transcript with fallback
-        transcript, transcription_method = fetch_youtube_transcript_with_fallback(url)
+        transcript, transcription_method, title, description = fetch_youtube_source(url)
         
         # Check for minimum transcript length
         if len(transcript) < 50:
             return jsonify({'error': 'Transcript too short, video may have no speech content'}), 400
         
-        # Extract video metadata
-        try:
-            ydl_opts = {'skip_download': True, 'quiet': True, 'no_warnings': True}
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                title = info.get('title')
-                description = info.get('description', '')[:200]  # First 200 chars
-        except:
-            title = None
-            description = None
-        
         structured_data = generate_summary(
             transcript, length, content_type='youtube',
             url=url, title=title, site_name='YouTube', description=description
         )
-        response = format_summary_response(structured_data)
-        citation = generate_citation(url, response.get('summary', ''))
-        
-        return jsonify({
-            **response,
-            'original_content': transcript,
-            'citation': citation,
-            'metadata': {
-                'source': 'YouTube',
-                'video_url': url,
-                'length': length,
-                'timestamp': time.time(),
-                'model': 'gemini-2.5-flash-lite',
-                'transcription_method': transcription_method
-            }
-        })
+        return jsonify(build_youtube_response(structured_data, url, transcript, length, transcription_method))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/follow-up', methods=['POST'])
-def follow_up_question():
-    """
-    Follow-up questions use both the summary and original source content
-    for deeper, more accurate answers.
-    """
+@app.route('/summarize-youtube-stream', methods=['POST'])
+def summarize_youtube_stream():
+    """Streaming variant of /summarize-youtube; same events as /summarize-stream."""
     data = request.get_json()
-    question = data.get('question', '')
-    context = data.get('context', '')
-    original_content = data.get('original_content', '')
-    history = data.get('history', [])
+    url = data.get('url', '')
+    length = data.get('length', 'M')
     
-    if not question:
-        return jsonify({'error': 'No question provided'}), 400
+    if not url or ('youtube.com' not in url and 'youtu.be' not in url):
+        return jsonify({'error': 'Invalid YouTube URL'}), 400
+    if not ACTIVE_PROVIDER:
+        return jsonify({'error': 'No LLM provider configured. Check .env file.'}), 503
+    try:
+        transcript, transcription_method, title, description = fetch_youtube_source(url)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
     
-    if not context:
-        return jsonify({'error': 'No context available. Summarize something first.'}), 400
+    # Check for minimum transcript length
+    if len(transcript) < 50:
+        return jsonify({'error': 'Transcript too short, video may have no speech content'}), 400
     
-    try:
-
-        history_text = ""
-        if history:
-            recent_history = history[-4:]  # Last 2 exchanges
-            for msg in recent_history:
-                role_label = "User" if msg["role"] == "user" else "Assistant"
-                history_text += f"{role_label}: {msg['content']}\n\n"
-        
-
-        source_section = ""
-        if original_content:
+    events = summary_event_stream(
+        transcript, length,
+        lambda structured_data: build_youtube_response(
+            structured_data, url, transcript, length, transcription_method
+        ),
+        content_type='youtube', url=url, title=title, site_name='YouTube', description=description
+    )
+    return Response(stream_with_context(events), mimetype='text/event-stream')
 
-            truncated_content = original_content[:12000]
-            was_truncated = len(original_content) > 12000
-            source_section = f"""\n\nOriginal Source Content{' (truncated)' if was_truncated else ''}:
-{truncated_content}"""
-        
-        prompt = f"""You are a helpful assistant answering follow-up questions about previously summarized content.
+FOLLOWUP_SYSTEM_PROMPT = """You are a helpful assistant answering follow-up questions about previously summarized content.
 
 Core Rules:
 - Use the summary for high-level context and the original source content for detailed answers
@@ -973,29 +1657,152 @@ Core Rules:
 - Never mention sponsors, ads, or promotional content
 - Never use quotation marks for emphasis (apostrophes in contractions are OK)
 - If the answer is not in either the summary or the original content, say so clearly
-- Stay focused on the substantive content
+- Stay focused on the substantive content"""
 
-Summary:
-{context}{source_section}
+FOLLOWUP_SOURCE_CHARS = 12000
+FOLLOWUP_PREFIX_CACHE_SIZE = 64
+_followup_prefix_cache = OrderedDict()  # conversation key -> [prefix, questions asked]
+_followup_prefix_lock = threading.Lock()
+
+def build_followup_prefix(context, original_content):
+    """
+    Render the part of a follow-up prompt that is fixed for a conversation
+    (rules, summary, source content). Cached so repeat questions reuse it.
+    Returns (conversation key, prefix).
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(context.encode('utf-8'))
+    hasher.update(b'\0')
+    hasher.update(original_content.encode('utf-8'))
+    key = hasher.hexdigest()
+    
+    with _followup_prefix_lock:
+        entry = _followup_prefix_cache.get(key)
+        if entry is not None:
+            entry[1] += 1
+            _followup_prefix_cache.move_to_end(key)
+            return key, entry[0]
+    
+    source_section = ""
+    if original_content:
+        truncated_content = original_content[:FOLLOWUP_SOURCE_CHARS]
+        was_truncated = len(original_content) > FOLLOWUP_SOURCE_CHARS
+        source_section = f"""\n\nOriginal Source Content{' (truncated)' if was_truncated else ''}:
+{truncated_content}"""
+    
+    prefix = f"""{FOLLOWUP_SYSTEM_PROMPT}
 
-Recent Conversation:
+Summary:
+{context}{source_section}"""
+    
+    with _followup_prefix_lock:
+        _followup_prefix_cache[key] = [prefix, 1]
+        if len(_followup_prefix_cache) > FOLLOWUP_PREFIX_CACHE_SIZE:
+            _followup_prefix_cache.popitem(last=False)
+    return key, prefix
+
+# Gemini explicit context caching of conversation prefixes: later questions send only
+# the recent turns and the question, and cached prefix tokens are billed at a discount.
+# Below Gemini's minimum cacheable size (~2048 tokens, roughly 4 chars each) it isn't used.
+# Most conversations ask a single question, so the cache is only created once a
+# conversation's prefix is used again; the first answer never waits on it.
+FOLLOWUP_GEMINI_CACHE_MIN_CHARS = 8192
+FOLLOWUP_GEMINI_CACHE_MIN_USES = 2
+FOLLOWUP_GEMINI_CACHE_TTL = timedelta(minutes=15)
+_followup_gemini_models = OrderedDict()
+
+def get_followup_cached_model(key, prefix):
+    """Gemini model reading from a context cache of this conversation's prefix, or None."""
+    if ACTIVE_PROVIDER != 'gemini' or len(prefix) < FOLLOWUP_GEMINI_CACHE_MIN_CHARS:
+        return None
+    
+    now = time.time()
+    with _followup_prefix_lock:
+        entry = _followup_gemini_models.get(key)
+        if entry and entry[1] > now:
+            _followup_gemini_models.move_to_end(key)
+            return entry[0]
+        prefix_entry = _followup_prefix_cache.get(key)
+        if prefix_entry is None or prefix_entry[1] < FOLLOWUP_GEMINI_CACHE_MIN_USES:
+            return None
+    
+    try:
+        cached = caching.CachedContent.create(
+            model='models/gemini-2.5-flash-lite',
+            contents=[prefix],
+            ttl=FOLLOWUP_GEMINI_CACHE_TTL,
+        )
+        model = genai.GenerativeModel.from_cached_content(cached_content=cached)
+    except Exception as e:
+        print(f"Gemini context cache unavailable, sending full prompt: {e}")
+        return None
+    
+    # Stop reusing a little before the server-side cache expires
+    expires_at = now + FOLLOWUP_GEMINI_CACHE_TTL.total_seconds() - 60
+    with _followup_prefix_lock:
+        _followup_gemini_models[key] = (model, expires_at)
+        if len(_followup_gemini_models) > FOLLOWUP_PREFIX_CACHE_SIZE:
+            _followup_gemini_models.popitem(last=False)
+    return model
+
+def drop_followup_cached_model(key):
+    """Forget a conversation's context cache (e.g. after it failed server-side)."""
+    with _followup_prefix_lock:
+        _followup_gemini_models.pop(key, None)
+
+def build_followup_question(question, history=None):
+    """Render the per-question tail of a follow-up prompt: recent turns, then the question."""
+    history_text = ""
+    if history:
+        recent_history = history[-4:]  # Last 2 exchanges
+        history_text = "".join(
+            f"{'User' if msg['role'] == 'user' else 'Assistant'}: {msg['content']}\n\n"
+            for msg in recent_history
+        )
+    
+    return f"""Recent Conversation:
 {history_text if history_text else "(No prior questions)"}
 
 User's Question:
 {question}
 
 Provide a clear, concise answer:"""
+
+@app.route('/follow-up', methods=['POST'])
+def follow_up_question():
+    """
+    Follow-up questions use both the summary and original source content
+    for deeper, more accurate answers.
+    """
+    data = request.get_json()
+    question = data.get('question', '')
+    context = data.get('context', '')
+    original_content = data.get('original_content', '')
+    history = data.get('history', [])
+    
+    if not question:
+        return jsonify({'error': 'No question provided'}), 400
+    
+    if not context:
+        return jsonify({'error': 'No context available. Summarize something first.'}), 400
+    
+    if not ACTIVE_PROVIDER:
+        return jsonify({'error': 'No LLM provider configured. Check .env file.'}), 503
+    
+    try:
+        key, prefix = build_followup_prefix(context, original_content)
+        question_text = build_followup_question(question, history)
         
-        response = model.generate_content(
-            prompt,
-            generation_config={
-                'temperature': 0.3,
-                'top_p': 0.8,
-                'top_k': 40,
-                'max_output_tokens': 1024,
-            }
-        )
-        answer = response.text.strip()
+        answer = None
+        cached_model = get_followup_cached_model(key, prefix)
+        if cached_model:
+            try:
+                answer, _ = _summarize_with_gemini(cached_model, question_text, 1024)
+            except Exception as e:
+                print(f"Cached follow-up failed, sending full prompt: {e}")
+                drop_followup_cached_model(key)
+        if answer is None:
+            answer, _ = complete_with_provider(ACTIVE_PROVIDER, f"{prefix}\n\n{question_text}", 1024)
         
         return jsonify({'answer': answer})
         
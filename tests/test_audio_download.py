@@ -10,15 +10,17 @@ print("=" * 50)
 print("Audio Download Test")
 print("=" * 50)
 
-def download_audio(youtube_url, output_path):
-    """Download audio from YouTube video."""
+def download_audio(youtube_url):
+    """Download audio from YouTube video. Returns (path, duration, title)."""
     ydl_opts = {
-        'format': 'bestaudio/best',
-        'outtmpl': output_path.replace('.m4a', ''),  # yt-dlp adds extension
-        'postprocessors': [{
-            'key': 'FFmpegExtractAudio',
-            'preferredcodec': 'm4a',
-        }],
+        # Take the native m4a stream as-is; no FFmpeg re-encode pass. itag 140
+        # (AAC 128k) is pinned first so the format chooser rarely has to run
+        'format': '140/bestaudio[ext=m4a]/bestaudio',
+        'check_formats': False,
+        'noplaylist': True,
+        'extractor_args': {'youtube': {'player_client': ['android', 'web']}},
+        'paths': {'home': tempfile.gettempdir()},
+        'outtmpl': '%(id)s.%(ext)s',
         'quiet': True,
         'no_warnings': True,
     }
@@ -27,27 +29,17 @@ def download_audio(youtube_url, output_path):
         info = ydl.extract_info(youtube_url, download=True)
         duration = info.get('duration', 0)
         title = info.get('title', 'Unknown')
-        return duration, title
+        # yt-dlp reports the exact file it wrote, whatever extension it chose
+        return info['requested_downloads'][0]['filepath'], duration, title
 
 # Test with a short video (Rick Astley - 3:33)
 test_url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
 
-# Create temp file
-temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.m4a')
-temp_path = temp_file.name
-temp_file.close()
-
 print(f"\nTest URL: {test_url}")
-print(f"Temp path: {temp_path}")
 
 try:
     print("\nDownloading audio...")
-    duration, title = download_audio(test_url, temp_path)
-    
-    # The actual file might have a different path due to yt-dlp naming
-    actual_path = temp_path.replace('.m4a', '') + '.m4a'
-    if not os.path.exists(actual_path):
-        actual_path = temp_path
+    actual_path, duration, title = download_audio(test_url)
     
     if os.path.exists(actual_path):
         file_size_mb = os.path.getsize(actual_path) / (1024 * 1024)
@@ -65,9 +57,5 @@ try:
         
 except Exception as e:
     print(f"\n✗ Error: {e}")
-    print("\nMake sure FFmpeg is installed and in your PATH:")
-    print("  1. Download from https://ffmpeg.org/download.html")
-    print("  2. Extract to C:\\ffmpeg")
-    print("  3. Add C:\\ffmpeg\\bin to your system PATH")
 
 print("=" * 50)
@@ -1,24 +1,33 @@
+import logging
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "http://127.0.0.1:5000"
 
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+log = logging.getLogger("smoke")
+
+# One keep-alive connection pool for every test request
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0))
+
 def test_health():
-    print("Testing /health ...", end=" ")
     try:
-        r = requests.get(f"{BASE_URL}/health")
+        r = SESSION.get(f"{BASE_URL}/health")
         if r.status_code == 200:
-            print("OK")
+            log.info("Testing /health ... OK")
             return True
         else:
-            print(f"FAIL ({r.status_code})")
+            log.info("Testing /health ... FAIL (%s)", r.status_code)
             return False
     except Exception as e:
-        print(f"FAIL: {e}")
+        log.info("Testing /health ... FAIL: %s", e)
         return False
 
 def test_summarize_with_length():
-    print("\nTesting /summarize with length parameter...")
+    log.info("\nTesting /summarize with length parameter...")
     
     text = """Artificial Intelligence (AI) is intelligence demonstrated by machines, 
     as opposed to the natural intelligence displayed by humans and animals. 
@@ -28,41 +37,81 @@ def test_summarize_with_length():
     that often fail to communicate with each other. These subfields include learning, reasoning, 
     problem solving, perception, and using language."""
     
-    for length in ['S', 'M', 'L', 'XL']:
-        print(f"  Length {length}: ", end="")
+    def run_one(length):
         try:
-            r = requests.post(f"{BASE_URL}/summarize", json={"text": text, "length": length})
+            r = SESSION.post(f"{BASE_URL}/summarize", json={"text": text, "length": length})
             if r.status_code == 200:
                 data = r.json()
                 if "heading" in data and "summary" in data:
                     summary_len = len(data['summary'])
-                    print(f"OK (heading: '{data['heading'][:30]}...', summary: {summary_len} chars)")
-                else:
-                    print(f"FAIL (missing fields: {list(data.keys())})")
-            else:
-                print(f"FAIL ({r.status_code})")
+                    return f"OK (heading: '{data['heading'][:30]}...', summary: {summary_len} chars)"
+                return f"FAIL (missing fields: {list(data.keys())})"
+            return f"FAIL ({r.status_code})"
         except Exception as e:
-            print(f"FAIL: {e}")
+            return f"FAIL: {e}"
+    
+    # The four lengths are independent, so request them concurrently; print in order
+    lengths = ['S', 'M', 'L', 'XL']
+    with ThreadPoolExecutor(max_workers=len(lengths)) as executor:
+        results = list(executor.map(run_one, lengths))
+    for length, result in zip(lengths, results):
+        log.info("  Length %s: %s", length, result)
 
 def test_follow_up():
-    print("\nTesting /follow-up ...")
+    log.info("\nTesting /follow-up ...")
     payload = {
         "question": "What is the main point?",
         "context": "AI is the simulation of human intelligence by machines.",
         "history": []
     }
     try:
-        r = requests.post(f"{BASE_URL}/follow-up", json=payload)
-        if r.status_code == 200 and "answer" in r.json():
-            print("  OK")
+        r = SESSION.post(f"{BASE_URL}/follow-up", json=payload)
+        data = r.json() if r.ok else None
+        if data and "answer" in data:
+            log.info("  OK")
+        else:
+            log.info("  FAIL (%s)", r.status_code)
+    except Exception as e:
+        log.info("  FAIL: %s", e)
+
+def test_summarize_urls():
+    log.info("\nTesting /summarize-urls ...")
+    payload = {
+        "urls": ["https://example.com", "https://example.org"],
+        "length": "M"
+    }
+    try:
+        r = SESSION.post(f"{BASE_URL}/summarize-urls", json=payload)
+        data = r.json() if r.ok else None
+        if data and len(data.get("results", [])) == len(payload["urls"]):
+            log.info("  OK")
+        else:
+            log.info("  FAIL (%s)", r.status_code)
+    except Exception as e:
+        log.info("  FAIL: %s", e)
+
+def test_summarize_stream():
+    log.info("\nTesting /summarize-stream ...")
+    payload = {
+        "text": "Artificial Intelligence (AI) is intelligence demonstrated by machines, as opposed to the natural intelligence displayed by humans and animals.",
+        "length": "M"
+    }
+    try:
+        r = SESSION.post(f"{BASE_URL}/summarize-stream", json=payload, stream=True)
+        events = [json.loads(line[len("data: "):]) for line in r.iter_lines(decode_unicode=True) if line.startswith("data: ")]
+        deltas = [e for e in events if "delta" in e]
+        if r.status_code == 200 and deltas and events[-1].get("done") and "summary" in events[-1]:
+            log.info("  OK (%d deltas)", len(deltas))
         else:
-            print(f"  FAIL ({r.status_code})")
+            log.info("  FAIL (%s, last event: %s)", r.status_code, events[-1] if events else None)
     except Exception as e:
-        print(f"  FAIL: {e}")
+        log.info("  FAIL: %s", e)
 
 if __name__ == "__main__":
     if test_health():
         test_summarize_with_length()
         test_follow_up()
+        test_summarize_urls()
+        test_summarize_stream()
     else:
-        print("Server not running!")
+        log.info("Server not running!")
@@ -2,16 +2,43 @@ import torch
 import time
 from transformers import pipeline
 
+# Inference only: no autograd bookkeeping anywhere in this script
+torch.set_grad_enabled(False)
+
 print("Loading model...")
 device = 0 if torch.cuda.is_available() else -1
+if device == -1:
+    # One request at a time: a single inter-op thread avoids oversubscribing the cores
+    # the intra-op pool (physical cores by default) is already using
+    torch.set_num_interop_threads(1)
+# FP16 halves memory traffic on GPU; falls back to FP32 below if it proves unstable
+use_fp16 = device == 0
 summarizer = pipeline(
     "summarization",
     model="facebook/bart-large-cnn",
     device=device,
-    torch_dtype=torch.float32  # Using FP32 for RTX 3050 stability
+    torch_dtype=torch.float16 if use_fp16 else torch.float32,
+    model_kwargs={
+        # Fused scaled_dot_product_attention kernels (FlashAttention/mem-efficient on GPU)
+        "attn_implementation": "sdpa",
+        # Memory-mapped safetensors weights, loaded without a second full copy in host RAM
+        "use_safetensors": True,
+        "low_cpu_mem_usage": True,
+    },
 )
 print(f"Model loaded on {'GPU' if device == 0 else 'CPU'}")
 
+summarizer.model.eval()
+# Greedy decoding with the KV cache: one decoder pass per token instead of BART-CNN's 4 beams
+summarizer.model.generation_config.use_cache = True
+
+# Compile forward (not the module, so generate()'s decoder steps use it) to cut
+# Python dispatch and fuse small ops; the first call pays compilation. On GPU,
+# max-autotune also benchmarks Triton kernels for the fused matmul/LayerNorm
+# epilogues and keeps reduce-overhead's CUDA graphs.
+compile_mode = "max-autotune" if device == 0 else "reduce-overhead"
+summarizer.model.forward = torch.compile(summarizer.model.forward, mode=compile_mode, fullgraph=False)
+
 test_text = (
     "Climate change refers to long-term shifts in temperatures and weather patterns. "
     "These shifts may be natural, but since the 1800s, human activities have been the main "
@@ -20,10 +47,70 @@ test_text = (
     "wrapped around the Earth, trapping the sun's heat and raising temperatures."
 )
 
-start = time.time()
-result = summarizer(test_text, max_length=50, min_length=10, do_sample=False)
-elapsed = time.time() - start
+def summarize(text, batch_size=1):
+    with torch.inference_mode(), torch.autocast("cuda", dtype=torch.float16, enabled=use_fp16):
+        return summarizer(
+            text, max_length=50, min_length=10, do_sample=False, num_beams=1, batch_size=batch_size
+        )
+
+def timed(fn, *args, **kwargs):
+    """Run fn and return (result, seconds): GPU time via CUDA events, else a monotonic clock."""
+    if device == 0:
+        start_event = torch.cuda.Event(enable_timing=True)
+        end_event = torch.cuda.Event(enable_timing=True)
+        start_event.record()
+        result = fn(*args, **kwargs)
+        end_event.record()
+        torch.cuda.synchronize()
+        return result, start_event.elapsed_time(end_event) / 1000.0
+    start_ns = time.perf_counter_ns()
+    result = fn(*args, **kwargs)
+    return result, (time.perf_counter_ns() - start_ns) / 1e9
+
+def output_is_sane(text, output):
+    """Unstable FP16 doesn't raise: it overflows to NaN/inf logits and empty or garbage text."""
+    if not output[0]['summary_text'].strip():
+        return False
+    inputs = summarizer.tokenizer(text, return_tensors="pt").to(summarizer.device)
+    decoder_input_ids = torch.full(
+        (1, 1), summarizer.model.config.decoder_start_token_id, device=summarizer.device
+    )
+    with torch.inference_mode(), torch.autocast("cuda", dtype=torch.float16, enabled=use_fp16):
+        logits = summarizer.model(**inputs, decoder_input_ids=decoder_input_ids).logits
+    return bool(torch.isfinite(logits).all())
+
+# Warm-up calls (compilation, CUDA init, graph capture) kept out of the timed region
+fp16_failure = None
+try:
+    warmup = summarize(test_text)
+    if use_fp16 and not output_is_sane(test_text, warmup):
+        fp16_failure = "empty or non-finite output"
+except RuntimeError as e:
+    if not use_fp16:
+        raise
+    fp16_failure = str(e)
+if fp16_failure:
+    print(f"FP16 inference failed ({fp16_failure}), retrying in FP32")
+    use_fp16 = False
+    summarizer.model.float()
+    summarize(test_text)
+
+# The compiled modes record CUDA graphs on the calls after compilation; replay them when timed
+summarize(test_text)
+if device == 0:
+    torch.cuda.synchronize()
+
+result, elapsed = timed(summarize, test_text)
+
+# Four inputs in one batched call vs four serial calls: batching amortizes kernel launches
+batch = [test_text] * 4
+summarize(batch, batch_size=len(batch))  # Warm-up for the new batch shape
+if device == 0:
+    torch.cuda.synchronize()
+
+_, batched_elapsed = timed(summarize, batch, batch_size=len(batch))
 
 print(f"Summary: {result[0]['summary_text']}")
 print(f"Inference time: {elapsed:.2f} seconds")
-print(f"Device used: {'GPU' if device == 0 else 'CPU'}")
+print(f"Batch of {len(batch)}: {batched_elapsed:.2f} seconds (vs ~{elapsed * len(batch):.2f} serial)")
+print(f"Device used: {'GPU' if device == 0 else 'CPU'} ({'FP16' if use_fp16 else 'FP32'})")
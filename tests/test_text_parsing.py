@@ -0,0 +1,79 @@
+"""
+Test script for caption and summary text parsing helpers.
+Run: python test_text_parsing.py (or pytest)
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from text_parsing import (
+    caption_text_words, extract_heading_from_markdown, json3_caption_words, split_sentences
+)
+
+
+def test_json3_cues_are_space_separated():
+    """Manual subtitles have no trailing space per cue; words must not fuse across cues."""
+    data = {'events': [
+        {'segs': [{'utf8': 'Hello world'}]},
+        {'segs': [{'utf8': 'Next line'}]},
+    ]}
+    assert json3_caption_words(data) == ['Hello', 'world', 'Next', 'line']
+
+
+def test_json3_segments_keep_their_spacing():
+    """Auto-caption segments within a cue carry their own leading spaces."""
+    data = {'events': [
+        {'segs': [{'utf8': 'auto'}, {'utf8': ' generated'}]},
+        {'segs': [{'utf8': '\n'}]},
+        {},
+        {'segs': [{'utf8': 'captions'}]},
+    ]}
+    assert json3_caption_words(data) == ['auto', 'generated', 'captions']
+
+
+def test_srv_cues_on_one_line_stay_separate():
+    """srv1/srv2 put adjacent <text> cues on one line; tags must not fuse their words."""
+    srv1 = '<?xml version="1.0"?><transcript><text start="0">Hello</text><text start="1">world &amp; more</text></transcript>'
+    assert caption_text_words(srv1) == ['Hello', 'world', '&', 'more']
+
+
+def test_vtt_keeps_caption_lines_that_look_like_markup():
+    """Only headers, NOTE blocks, timings and the cue ids right before them are dropped."""
+    vtt = (
+        'WEBVTT\nKind: captions\nLanguage: en\n\n'
+        'NOTE a comment\nspanning lines\n\n'
+        '1\n00:00:01.000 --> 00:00:02.000 align:start\n1984\n12:30 is lunch\n\n'
+        '2\n00:00:03.000 --> 00:00:04.000\nNOTE this <c>works</c>\n'
+    )
+    expected = ['1984', '12:30', 'is', 'lunch', 'NOTE', 'this', 'works']
+    assert caption_text_words(vtt) == expected
+    assert caption_text_words(vtt.replace('\n', '\r\n')) == expected
+
+
+def test_heading_skips_empty_heading_lines():
+    """A bare '###' line is not a heading; the first real one wins."""
+    assert extract_heading_from_markdown("### \n## Real Heading\nBody text") == 'Real Heading'
+
+
+def test_heading_falls_back_to_first_line():
+    """Without a heading, the first line is used with its markdown stripped."""
+    assert extract_heading_from_markdown("**Plain** opening line\nMore") == 'Plain opening line'
+
+
+
+def test_sentences_do_not_break_on_abbreviations():
+    """Abbreviations and initials do not end a sentence."""
+    assert split_sentences("Dr. Smith went to Washington. He met J. Doe, e.g. the president.") == [
+        'Dr. Smith went to Washington.', 'He met J. Doe, e.g. the president.'
+    ]
+
+if __name__ == '__main__':
+    print("=" * 50)
+    print("Text Parsing Test")
+    print("=" * 50)
+    for name, func in list(globals().items()):
+        if name.startswith('test_') and callable(func):
+            func()
+            print(f"✓ {name}")
+    print("=" * 50)
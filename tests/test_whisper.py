@@ -18,11 +18,12 @@ if torch.cuda.is_available():
 # Load Whisper
 print("\nLoading Whisper model (base)...")
 try:
-    import whisper
+    from faster_whisper import WhisperModel
     device = "cuda" if torch.cuda.is_available() else "cpu"
-    model = whisper.load_model("base", device=device)
-    print(f"✓ Model loaded on: {device}")
-    print(f"✓ Model parameters device: {next(model.parameters()).device}")
+    compute_type = "float16" if device == "cuda" else "int8"
+    model = WhisperModel("base", device=device, compute_type=compute_type)
+    print(f"✓ Model loaded on: {device} ({compute_type})")
+    print(f"✓ Model device: {model.model.device}")
     print("\nAvailable Whisper models:")
     print("  tiny    (~39M params, ~1GB VRAM)")
     print("  base    (~74M params, ~1.5GB VRAM) ← Currently loaded")
@@ -31,7 +32,7 @@ try:
     print("  large-v3 (~1550M params, ~10GB VRAM)")
     print("\n✓ Whisper is ready for audio transcription!")
 except ImportError:
-    print("✗ Whisper not installed. Run: pip install openai-whisper")
+    print("✗ faster-whisper not installed. Run: pip install faster-whisper")
 except Exception as e:
     print(f"✗ Error loading Whisper: {e}")
 
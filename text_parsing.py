@@ -0,0 +1,79 @@
+"""
+Pure text parsing helpers for summaries and captions.
+Kept free of model, cache and client setup so they import (and test) on their own.
+"""
+import html
+import re
+
+_HEADING_RE = re.compile(r'^[ \t]*#{1,3} +(\S.*)$', re.MULTILINE)
+_STRIP_HASH_RE = re.compile(r'^#+\s*')
+_STRIP_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+
+# Caption lines that carry no transcript text: a WebVTT cue timing line together with
+# the cue id line right before it, the WebVTT header block, and NOTE comment blocks
+_SUBTITLE_SKIP_RE = re.compile(
+    r'^(?:.*\n)?.*-->.*$'
+    r'|\A\ufeff?WEBVTT.*(?:\n.*\S.*)*'
+    r'|(?:\A|(?<=\n\n)|(?<=\n\r\n))NOTE\b.*(?:\n.*\S.*)*',
+    re.MULTILINE
+)
+_SUBTITLE_TAG_RE = re.compile(r'<[^>]+>')
+
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+')
+# Abbreviations whose trailing period does not end a sentence
+_ABBREVIATIONS = frozenset((
+    'mr.', 'mrs.', 'ms.', 'dr.', 'prof.', 'st.', 'jr.', 'sr.', 'vs.', 'etc.',
+    'e.g.', 'i.e.', 'inc.', 'ltd.', 'co.', 'no.', 'u.s.', 'fig.', 'approx.',
+))
+
+def extract_heading_from_markdown(text):
+    """Extract first heading from markdown text (### or ##), or generate a default."""
+    match = _HEADING_RE.search(text)
+    if match:
+        return match.group(1).strip()
+    
+    text = text.strip()
+    first_line = text.split('\n', 1)[0]
+    # Remove any markdown formatting from first line
+    first_line = _STRIP_HASH_RE.sub('', first_line)
+    first_line = _STRIP_BOLD_RE.sub(r'\1', first_line)
+    first_line = first_line.strip()
+    
+    
+    if len(first_line) > 80:
+        first_line = first_line[:77] + '...'
+    
+    return first_line if first_line else 'Summary'
+
+def json3_caption_words(data):
+    """Return the words of parsed json3 captions."""
+    # Segments within an event carry their own spacing; separate events (cues) with a space
+    text = ' '.join(
+        ''.join(seg.get('utf8', '') for seg in event.get('segs') or ())
+        for event in data.get('events', ())
+    )
+    return text.split()
+
+def caption_text_words(text):
+    """Return the words of WebVTT or srv1/srv2/srv3 captions."""
+    # Tags become spaces, since srv formats put adjacent cues on one line;
+    # each step is one regex/C pass over the whole file rather than a loop per line
+    text = _SUBTITLE_TAG_RE.sub(' ', text)
+    text = html.unescape(_SUBTITLE_SKIP_RE.sub('', text))
+    return text.split()
+
+def split_sentences(text):
+    """Split text into sentences on terminal punctuation, keeping abbreviations and initials intact."""
+    sentences = []
+    for piece in _SENTENCE_BOUNDARY_RE.split(' '.join(text.split())):
+        if not piece:
+            continue
+        if sentences:
+            last_word = sentences[-1].rsplit(' ', 1)[-1]
+            # "Dr. Smith", "J. Doe" and "e.g. this" continue the previous sentence
+            if (last_word.lower() in _ABBREVIATIONS or (len(last_word) == 2 and last_word[0].isupper())
+                    or piece[0].islower()):
+                sentences[-1] += ' ' + piece
+                continue
+        sentences.append(piece)
+    return sentences